@@ -12,9 +12,12 @@ from .checker import (
     DangerousPathError,
     PathChecker,
     add_user_path,
+    bulk_is_dangerous,
     clear_user_paths,
+    filter_safe,
     get_dangerous_paths,
     get_user_paths,
+    get_user_paths_view,
     is_dangerous_path,
     is_sensitive_path,
     is_system_path,
@@ -24,6 +27,8 @@ from .checker import (
 __all__ = [
     "PathChecker",
     "is_dangerous_path",
+    "bulk_is_dangerous",
+    "filter_safe",
     "is_system_path",
     "is_sensitive_path",
     "get_dangerous_paths",
@@ -32,4 +37,5 @@ __all__ = [
     "remove_user_path",
     "clear_user_paths",
     "get_user_paths",
+    "get_user_paths_view",
 ]
@@ -8,16 +8,54 @@ and validation of platform-specific invalid characters.
 
 import os
 import platform
+import re
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from functools import cache, lru_cache
+from importlib import import_module
 from pathlib import Path
+from typing import ClassVar
+
+# The running platform cannot change at runtime, so look it up once at import
+_SYSTEM = platform.system()
+
+# Name of the bad_path.platforms subpackage for the running platform
+# (Linux and other Unix-like systems use the POSIX implementation)
+_PLATFORM_PACKAGE = {"Windows": "windows", "Darwin": "darwin"}.get(_SYSTEM, "posix")
+
+# Platform system paths, imported once rather than on every call and frozen as a tuple
+# since the resolved matcher built from them is cached for the life of the process
+_PLATFORM_PATHS = import_module(f".platforms.{_PLATFORM_PACKAGE}.paths", __package__)
+_SYSTEM_PATHS: tuple[str, ...] = tuple(_PLATFORM_PATHS.system_paths)
+_SYSTEM_PATHS_SET = frozenset(_SYSTEM_PATHS)
 
 
 class DangerousPathError(PermissionError):
     """Exception raised when a dangerous path is detected."""
 
 
-# Module-level list of user-defined dangerous paths
-_user_defined_paths: list[str] = []
+# Module-level user-defined dangerous paths. A dict (with unused values) is used as an
+# insertion-ordered set, giving O(1) membership tests, additions and removals.
+_user_defined_paths: dict[str, None] = {}
+
+# Incremented whenever _user_defined_paths changes so derived data can be cached safely
+_user_paths_version = 0
+
+# Below this many paths a single (C-level) str.startswith() scan beats a compiled regular
+# expression; measured crossover is roughly 16-24 paths
+_REGEX_MIN_PATHS = 24
+
+# (system_ok, user_paths_ok, not_writeable) flags set by each PathChecker mode
+_MODE_FLAGS: dict[str, tuple[bool, bool, bool]] = {
+    # For reading: allow system paths, user paths, and non-writable paths
+    "read": (True, True, True),
+    # For writing: strict validation (default flags)
+    "write": (False, False, False),
+}
+
+# Largest number of resolved paths whose matches a PathChecker remembers between __call__ calls
+_CALL_CACHE_SIZE = 1024
 
 
 # ============================================================================
@@ -38,7 +76,8 @@ def add_user_path(path: str | Path) -> None:
     """
     path_str = str(path)
     if path_str not in _user_defined_paths:
-        _user_defined_paths.append(path_str)
+        _user_defined_paths[path_str] = None
+        _user_paths_changed()
 
 
 def remove_user_path(path: str | Path) -> None:
@@ -58,7 +97,8 @@ def remove_user_path(path: str | Path) -> None:
     """
     path_str = str(path)
     if path_str in _user_defined_paths:
-        _user_defined_paths.remove(path_str)
+        del _user_defined_paths[path_str]
+        _user_paths_changed()
     else:
         raise ValueError(f"Path '{path_str}' is not in the user-defined paths list")
 
@@ -73,6 +113,17 @@ def clear_user_paths() -> None:
         []
     """
     _user_defined_paths.clear()
+    # Nothing refers to the previously resolved user paths any more, so drop them too
+    _resolved_prefix.cache_clear()
+    _user_paths_changed()
+
+
+def _user_paths_changed() -> None:
+    """Invalidate data derived from the user-defined paths after they have been modified."""
+    global _user_paths_version  # pylint: disable=global-statement
+    _user_paths_version += 1
+    _is_listed_prefix.cache_clear()
+    _default_checker.cache_clear()
 
 
 def get_user_paths() -> list[str]:
@@ -88,7 +139,33 @@ def get_user_paths() -> list[str]:
         >>> "/home/user/sensitive" in paths
         True
     """
-    return _user_defined_paths.copy()
+    return list(_user_defined_paths)
+
+
+def get_user_paths_view() -> tuple[str, ...]:
+    """Get a read-only snapshot of the user-defined dangerous paths.
+
+    Returns:
+        (tuple[str, ...]):
+            The user-defined dangerous path patterns, in the order they were added.
+
+    Notes:
+        Unlike get_user_paths(), which builds a new list on every call, the tuple is built
+        once each time the user-defined paths change and then shared between calls. It is
+        not affected by later calls to add_user_path() or remove_user_path().
+
+    Examples:
+        >>> add_user_path("/home/user/sensitive")
+        >>> get_user_paths_view()
+        ('/home/user/sensitive',)
+    """
+    return _user_paths_tuple(_user_paths_version)
+
+
+@lru_cache(maxsize=1)
+def _user_paths_tuple(version: int) -> tuple[str, ...]:
+    """Build the user-defined paths tuple; the version is used only as a cache key."""
+    return tuple(_user_defined_paths)
 
 
 def get_dangerous_paths() -> list[str]:
@@ -109,23 +186,150 @@ def get_dangerous_paths() -> list[str]:
         >>> "/custom/path" in get_dangerous_paths()
         True
     """
-    match platform.system():
-        case "Windows":
-            from .platforms.windows.paths import (
-                system_paths,
-            )  # pylint: disable=import-outside-toplevel
-        case "Darwin":
-            from .platforms.darwin.paths import (
-                system_paths,
-            )  # pylint: disable=import-outside-toplevel
-        case _:  # Linux and other Unix-like systems
-            from .platforms.posix.paths import (
-                system_paths,
-            )  # pylint: disable=import-outside-toplevel
+    return list(_dangerous_paths_set(_user_paths_version))
 
+
+@lru_cache(maxsize=1)
+def _dangerous_paths_set(version: int) -> frozenset[str]:
+    """Build the merged dangerous paths set; the version is used only as a cache key."""
     # Merge system paths and user-defined paths using sets to avoid duplicates
-    all_paths = set(system_paths) | set(_user_defined_paths)
-    return list(all_paths)
+    return _SYSTEM_PATHS_SET.union(_user_defined_paths)
+
+
+def _path_prefix(path: str | Path) -> str:
+    """Return the case-normalised string form of a path with a single trailing separator."""
+    return os.path.normcase(str(path)).rstrip(os.sep) + os.sep
+
+
+def _resolve_path(path: str | Path, follow_symlinks: bool = True) -> str:
+    """Return the absolute, normalised form of a path, or the path itself if that fails.
+
+    Symbolic links are resolved only if follow_symlinks is True; otherwise the path is
+    resolved lexically, without querying the filesystem for each component.
+    """
+    path_str = os.fspath(path)
+    try:
+        if follow_symlinks:
+            return os.path.realpath(path_str)
+        return os.path.abspath(path_str)
+    except (ValueError, OSError):
+        # If path contains invalid characters that prevent resolution,
+        # fall back to the non-resolved path
+        return path_str
+
+
+def _path_prefixes(paths: Iterable[str], cwd: str | None = None) -> tuple[str, ...]:
+    """Resolve path strings into prefixes, dropping any that cannot be resolved."""
+    prefixes = []
+    for path in paths:
+        try:
+            prefixes.append(_resolved_prefix(path, None if os.path.isabs(path) else cwd))
+        except (OSError, ValueError):
+            # Handle cases where path resolution fails
+            continue
+    return tuple(prefixes)
+
+
+@lru_cache(maxsize=1024)
+def _resolved_prefix(path: str, cwd: str | None) -> str:
+    """Resolve one path string into a prefix; *cwd* only keys the cache for relative paths."""
+    # Interning lets every checker and matcher share one copy of each prefix string
+    return sys.intern(_path_prefix(os.path.realpath(path)))
+
+
+class _PathMatcher:
+    """Match paths against a fixed collection of resolved path prefixes.
+
+    Small collections are matched with a single str.startswith() call. Larger ones are
+    compiled into one regular expression shaped like a character trie of the prefixes, so
+    that the regex engine tests them all in a single left-to-right pass over the path.
+    """
+
+    __slots__ = ("prefixes", "_pattern")
+
+    def __init__(self, prefixes: tuple[str, ...]):
+        """Build the matcher, compiling a regular expression if there are enough prefixes."""
+        self.prefixes = _outermost_prefixes(prefixes)
+        prefixes = self.prefixes
+        self._pattern: re.Pattern[str] | None = None
+        if len(prefixes) >= _REGEX_MIN_PATHS:
+            try:
+                self._pattern = re.compile(_trie_pattern(prefixes))
+            except (RecursionError, re.error):
+                # Pathologically deep tries are left to str.startswith()
+                self._pattern = None
+
+    def match(self, path_prefix: str) -> bool:
+        """Return True if a path (as returned by _path_prefix()) is, or is beneath, any prefix."""
+        if self._pattern is None:
+            return path_prefix.startswith(self.prefixes)
+        return self._pattern.match(path_prefix) is not None
+
+
+def _outermost_prefixes(prefixes: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the prefixes in sorted order without duplicates or any lying beneath another.
+
+    A prefix beneath another (such as /usr/bin/ beneath /usr/) can never change the outcome
+    of a match, so dropping it leaves fewer comparisons for paths that match nothing.
+    """
+    kept: list[str] = []
+    for prefix in sorted(set(prefixes)):
+        # In sorted order anything beneath a kept prefix follows it directly
+        if not kept or not prefix.startswith(kept[-1]):
+            kept.append(prefix)
+    return tuple(kept)
+
+
+def _trie_pattern(prefixes: tuple[str, ...]) -> str:
+    """Return a regular expression source matching any string that starts with one of prefixes.
+
+    The prefixes are arranged into a character trie and each branch point becomes an
+    alternation, so no character of the candidate is examined more than once per branch.
+    """
+    trie: dict = {}
+    for prefix in prefixes:
+        node = trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        # An empty-string key marks the end of a prefix
+        node[""] = None
+
+    def _emit(node: dict) -> str:
+        chain = []
+        # Runs of single-child nodes become a plain literal rather than nested groups
+        while len(node) == 1 and "" not in node:
+            char, node = next(iter(node.items()))
+            chain.append(char)
+        literal = re.escape("".join(chain))
+        if "" in node:
+            # Anything beneath a complete prefix matches, so deeper branches are irrelevant
+            return literal
+        branches = "|".join(re.escape(char) + _emit(child) for char, child in node.items())
+        return f"{literal}(?:{branches})"
+
+    return _emit(trie)
+
+
+@cache
+def _system_path_matcher() -> _PathMatcher:
+    """Return the matcher for the platform system paths, resolved once on first use."""
+    return _PathMatcher(_path_prefixes(_SYSTEM_PATHS))
+
+
+def _user_path_matcher() -> _PathMatcher:
+    """Return the matcher for the user-defined paths, rebuilt only when they or the CWD change."""
+    try:
+        # Relative user paths resolve against the CWD, so it forms part of the cache key
+        cwd = os.getcwd()
+    except OSError:
+        cwd = None
+    return _build_user_path_matcher(_user_paths_version, cwd)
+
+
+@lru_cache(maxsize=1)
+def _build_user_path_matcher(version: int, cwd: str | None) -> _PathMatcher:
+    """Build the user-defined path matcher; the arguments are used only as a cache key."""
+    return _PathMatcher(_path_prefixes(_user_defined_paths, cwd))
 
 
 # ============================================================================
@@ -149,14 +353,17 @@ def is_system_path(path: str | Path) -> bool:
         paths for backward compatibility (originally used get_dangerous_paths() which
         returns both). Use PathChecker class for fine-grained control.
 
+        As for is_dangerous_path(), the path is resolved afresh on every call and only its match
+        against the dangerous paths is memoised. The cache is cleared whenever the user-defined
+        paths change; call is_system_path.cache_clear() to discard it.
+
     Examples:
         >>> is_system_path("/etc/passwd")  # On POSIX systems
         True
         >>> is_system_path("/home/user/file.txt")
         False
     """
-    checker = PathChecker(path)
-    return checker.is_system_path or checker.is_sensitive_path
+    return _is_listed_path(path)
 
 
 def is_sensitive_path(path: str | Path) -> bool:
@@ -176,6 +383,7 @@ def is_sensitive_path(path: str | Path) -> bool:
     Notes:
         This function checks BOTH system and user-defined paths (same as is_system_path)
         for backward compatibility. Use PathChecker class for fine-grained control.
+        It shares its result cache with is_system_path().
 
     Examples:
         >>> is_sensitive_path("/etc/passwd")  # On POSIX systems
@@ -184,8 +392,7 @@ def is_sensitive_path(path: str | Path) -> bool:
         >>> is_sensitive_path("/custom/sensitive/file.txt")
         True
     """
-    checker = PathChecker(path)
-    return checker.is_system_path or checker.is_sensitive_path
+    return _is_listed_path(path)
 
 
 def is_dangerous_path(path: str | Path, raise_error: bool = False) -> bool:
@@ -208,6 +415,13 @@ def is_dangerous_path(path: str | Path, raise_error: bool = False) -> bool:
         DangerousPathError:
             If raise_error is True and the path is dangerous.
 
+    Notes:
+        The path is resolved and its writability checked afresh on every call, so the result
+        always reflects the current state of the filesystem. Only the match of the resolved
+        path against the dangerous paths is memoised, in a bounded cache that is cleared
+        automatically whenever the user-defined paths change; call
+        is_dangerous_path.cache_clear() to discard it.
+
     Examples:
         >>> is_dangerous_path("/home/user/file.txt")
         False
@@ -218,15 +432,92 @@ def is_dangerous_path(path: str | Path, raise_error: bool = False) -> bool:
             ...
         DangerousPathError: Path '/etc/passwd' points to a dangerous system location
     """
-    try:
-        checker = PathChecker(path, raise_error=raise_error)
-        # Invert PathChecker's boolean (True when safe)
-        # to match function name (returns True when dangerous)
-        return not bool(checker)
-    except DangerousPathError:
-        # PathChecker raises with message "dangerous location"
-        # But for backward compatibility, we need "dangerous system location"
-        raise DangerousPathError(f"Path '{path}' points to a dangerous system location")
+    # Calling a checker with a path runs the same checks as constructing one for it
+    # (and, like is_dangerous_path, returns True when dangerous) without a new instance
+    if _default_checker(_user_path_matcher())(path):
+        if raise_error:
+            # For backward compatibility the message says "dangerous system location"
+            raise DangerousPathError(f"Path '{path}' points to a dangerous system location")
+        return True
+    return False
+
+
+def bulk_is_dangerous(paths: Iterable[str | Path]) -> list[bool]:
+    """Check many paths for danger in one call.
+
+    Args:
+        paths (Iterable[str | Path]):
+            The file paths to check.
+
+    Returns:
+        (list[bool]):
+            For each path, in order, True if it is dangerous, False otherwise.
+
+    Notes:
+        Each path is checked exactly as by is_dangerous_path(). The platform and user-defined
+        paths are loaded once and shared across the whole batch, so the per-path cost is just
+        resolving the path and matching it. Paths repeated within the batch are only checked once.
+
+    Examples:
+        >>> bulk_is_dangerous(["/home/user/file.txt", "/etc/passwd"])  # On POSIX systems
+        [False, True]
+    """
+    # A single checker carries the loaded matchers and checks each path against them
+    return _default_checker(_user_path_matcher()).check_many(paths)
+
+
+def filter_safe(paths: Iterable[str | Path]) -> list[str | Path]:
+    """Return only the paths that are safe, in their original order.
+
+    Args:
+        paths (Iterable[str | Path]):
+            The file paths to filter.
+
+    Returns:
+        (list[str | Path]):
+            The input paths for which is_dangerous_path() would return False, unchanged.
+
+    Notes:
+        The paths are checked in a single batch by bulk_is_dangerous(), so the dangerous
+        path lists are loaded once however many paths are given.
+
+    Examples:
+        >>> filter_safe(["/home/user/file.txt", "/etc/passwd"])  # On POSIX systems
+        ['/home/user/file.txt']
+    """
+    paths = list(paths)
+    return [path for path, is_dangerous in zip(paths, bulk_is_dangerous(paths)) if not is_dangerous]
+
+
+def _is_listed_path(path: str | Path) -> bool:
+    """Return whether a path is, or lies beneath, a system or user-defined path."""
+    # Resolved afresh on every call, since the path may have become a symbolic link since it
+    # was last checked; only the match of the resolved path is memoised
+    return _is_listed_prefix(_path_prefix(_resolve_path(path)), _user_path_matcher())
+
+
+@lru_cache(maxsize=1024)
+def _is_listed_prefix(prefix: str, user_paths: _PathMatcher) -> bool:
+    """Return whether a resolved path prefix is under a system or user path."""
+    # Matched directly rather than through a PathChecker, whose other checks are not needed here
+    return _system_path_matcher().match(prefix) or user_paths.match(prefix)
+
+
+@lru_cache(maxsize=1)
+def _default_checker(user_paths: _PathMatcher) -> "PathChecker":
+    """Return a checker with the default flags, shared until the user path matcher changes.
+
+    Sharing is safe because a checker called with a path resolves it and checks its
+    writability afresh each time; the only state it keeps is the pure string match of
+    resolved paths against the loaded system and user paths.
+    """
+    return PathChecker(os.curdir)
+
+
+# The shared checker holds the memoised matches, so discarding it discards them too
+is_dangerous_path.cache_clear = _default_checker.cache_clear  # type: ignore[attr-defined]
+is_system_path.cache_clear = _is_listed_prefix.cache_clear  # type: ignore[attr-defined]
+is_sensitive_path.cache_clear = _is_listed_prefix.cache_clear  # type: ignore[attr-defined]
 
 
 # ============================================================================
@@ -274,6 +565,11 @@ class BasePathChecker(ABC):
             to prevent path traversal attacks. Paths that resolve outside
             the CWD (e.g., '../../../etc/passwd') are considered dangerous.
             Defaults to False.
+        follow_symlinks (bool):
+            If True, resolve symbolic links before checking the path, so a link
+            pointing into a system directory is caught. If False, the path is only
+            made absolute and normalised, which avoids a filesystem lookup per path
+            component but will not see through symbolic links. Defaults to True.
 
     Raises:
         DangerousPathError:
@@ -320,6 +616,31 @@ class BasePathChecker(ABC):
         Safe for writing!
     """
 
+    # Fixed attribute layout: no per-instance __dict__ and faster attribute access
+    __slots__ = (
+        "_path",
+        "_raise_error",
+        "_mode",
+        "_system_ok",
+        "_user_paths_ok",
+        "_not_writeable",
+        "_cwd_only",
+        "_follow_symlinks",
+        "_invalid_chars",
+        "_path_str",
+        "_path_obj_cache",
+        "_has_invalid_chars",
+        "_system_paths",
+        "_user_paths",
+        "_is_system_path",
+        "_is_user_path",
+        "_call_cache",
+    )
+
+    # True if _check_invalid_chars() examines the resolved path rather than the path as given;
+    # __call__ follows the same choice so that it agrees with constructing a checker
+    _INVALID_CHARS_RESOLVED: ClassVar[bool] = False
+
     def __init__(
         self,
         path: str | Path,
@@ -329,6 +650,7 @@ class BasePathChecker(ABC):
         user_paths_ok: bool = False,
         not_writeable: bool = False,
         cwd_only: bool = False,
+        follow_symlinks: bool = True,
     ):
         """Initialise the PathChecker with a path to check."""
         self._path = path
@@ -336,60 +658,57 @@ class BasePathChecker(ABC):
         self._mode = mode
 
         # Handle mode parameter
-        match mode:
-            case "read":
-                # For reading: allow system paths, user paths, and non-writable paths
-                self._system_ok = True
-                self._user_paths_ok = True
-                self._not_writeable = True
-            case "write":
-                # For writing: strict validation (default flags)
-                self._system_ok = False
-                self._user_paths_ok = False
-                self._not_writeable = False
-            case None:
-                # No mode specified - use individual flags
-                self._system_ok = system_ok
-                self._user_paths_ok = user_paths_ok
-                self._not_writeable = not_writeable
-            case _:
+        if mode is None:
+            # No mode specified - use individual flags
+            flags = (system_ok, user_paths_ok, not_writeable)
+        else:
+            flags = _MODE_FLAGS.get(mode) if isinstance(mode, str) else None
+            if flags is None:
                 raise ValueError(f"Invalid mode '{mode}'. Must be None, 'read', or 'write'.")
+        self._system_ok, self._user_paths_ok, self._not_writeable = flags
 
-        # Handle cwd_only flag (independent of mode)
+        # Handle cwd_only and follow_symlinks flags (independent of mode)
         self._cwd_only = cwd_only
+        self._follow_symlinks = follow_symlinks
 
         # Load platform-specific invalid characters first (before resolve)
         self._load_invalid_chars()
 
-        # Try to resolve the path, but handle errors gracefully
-        try:
-            self._path_obj = Path(path).resolve()
-        except (ValueError, OSError):
-            # If path contains invalid characters that prevent resolution,
-            # create a non-resolved Path object
-            self._path_obj = Path(path)
+        # Resolve the path as a plain string; a Path object is only built on demand
+        self._path_str = _resolve_path(path, follow_symlinks)
+        self._path_obj_cache: Path | None = None
 
-        # Check for invalid characters before attempting to resolve the path
-        # (some invalid chars like null byte will cause resolve to fail)
-        self._has_invalid_chars = self._check_invalid_chars()
+        # The invalid character and path checks are deferred until first needed;
+        # None marks a check that has not been run yet
+        self._has_invalid_chars: bool | None = None
 
-        # Load paths and check the initial path
+        # Load paths (snapshotting the current user-defined paths)
+        self._system_paths = self._user_paths = None
+        self._call_cache: dict[str, tuple[bool, bool]] | None = None
         self._load_and_check_paths()
 
-        # Raise error if requested and path is dangerous
-        is_dangerous = self._is_dangerous()
-        if self._raise_error and is_dangerous:
+        # Raise error if requested and path is dangerous (this forces the checks)
+        if self._raise_error and self._is_dangerous():
             raise DangerousPathError(f"Path '{path}' points to a dangerous location")
 
     @abstractmethod
     def _load_invalid_chars(self) -> None:
-        """Load platform-specific invalid characters and reserved names."""
+        """Load platform-specific invalid characters."""
         ...
 
-    @abstractmethod
     def _load_and_check_paths(self) -> None:
-        """Load system and user paths, then check the current path against them."""
-        ...
+        """Load system and user paths; the current path is checked against them on first use."""
+        system_paths = _system_path_matcher()
+        user_paths = _user_path_matcher()
+        if system_paths is self._system_paths and user_paths is self._user_paths:
+            # Nothing has changed since the paths were last loaded, so earlier results still hold
+            return
+        self._system_paths = system_paths
+        self._user_paths = user_paths
+
+        # Defer checking both types until first needed
+        self._is_system_path = self._is_user_path = None
+        self._call_cache = None
 
     def _is_dangerous(self) -> bool:
         """Check if the path is dangerous based on current settings.
@@ -398,101 +717,97 @@ class BasePathChecker(ABC):
             (bool):
                 True if the path is dangerous considering all flags, False otherwise.
         """
+        # The checks run cheapest first: those needing no system calls, then the CWD
+        # restriction (usually a single getcwd()), then writability (a stat() and an access())
+
+        # Check invalid characters (always dangerous)
+        if self.has_invalid_chars:
+            return True
+
         # Check system paths (unless allowed)
-        if self._is_system_path and not self._system_ok:
+        if self.is_system_path and not self._system_ok:
             return True
 
         # Check user paths (unless allowed)
-        if self._is_user_path and not self._user_paths_ok:
+        if self.is_sensitive_path and not self._user_paths_ok:
             return True
 
-        # Check invalid characters (always dangerous)
-        if self._has_invalid_chars:
+        # Check CWD restriction
+        if self._cwd_only and self._check_cwd_traversal():
             return True
 
         # Check writeability
         if not self._not_writeable:
             # If not_writeable is False, non-writable existing paths are considered dangerous
-            if self._path_obj.exists() and not self.is_writable:
+            if os.path.exists(self._path_str) and not self.is_writable:
                 return True
 
-        # Check CWD restriction
-        if self._cwd_only and self._check_cwd_traversal():
-            return True
-
         return False
 
-    def _check_cwd_traversal(self, path_obj: Path | None = None) -> bool:
+    def _check_cwd_traversal(self, path_str: str | None = None) -> bool:
         """Check if a path traverses outside the current working directory.
 
         Keyword Parameters:
-            path_obj (Path | None):
-                Optional Path object to check. If not provided, uses self._path_obj.
-                Defaults to None.
+            path_str (str | None):
+                Optional resolved path string to check. If not provided, uses the
+                resolved form of self._path. Defaults to None.
 
         Returns:
             (bool):
                 True if the path is outside CWD (dangerous), False otherwise.
+
+        Notes:
+            The path and the CWD are compared as case-normalised prefixes, in the same way as
+            the dangerous paths are matched, so the comparison is case-insensitive on Windows
+            and the CWD itself counts as within the CWD.
         """
-        if path_obj is None:
-            path_obj = self._path_obj
+        if path_str is None:
+            path_str = self._path_str
 
         try:
-            cwd = Path.cwd().resolve()
+            cwd = os.getcwd()
+            # Resolved once per distinct CWD through the same cache as the user paths
+            cwd_prefix = _resolved_prefix(cwd, None)
+        except (OSError, RuntimeError, ValueError):
+            # If the CWD cannot be resolved, treat as dangerous
+            return True
 
-            # Check if path equals CWD (handles "." case)
-            # Use case-sensitive comparison for Linux/macOS
-            if path_obj == cwd:
-                return False  # Path is CWD itself (safe)
+        # The path is the CWD itself or lies within it (safe)
+        if _path_prefix(path_str).startswith(cwd_prefix):
+            return False
 
-            # Also try samefile() if paths exist (handles symlinks, etc.)
-            try:
-                if path_obj.exists() and cwd.exists() and path_obj.samefile(cwd):
-                    return False  # Same file/directory (safe)
-            except (OSError, ValueError, AttributeError):
-                # samefile() not available or failed, continue with relative_to
-                pass
-
-            # Try to express path_obj relative to cwd
-            # If this succeeds, the path is within CWD
-            path_obj.relative_to(cwd)
-            return False  # Path is within CWD (safe)
-        except ValueError:
-            # relative_to raised ValueError, so path is outside CWD
-            return True  # Path is outside CWD (dangerous)
-        except (OSError, RuntimeError):
-            # If other resolution fails, treat as dangerous
+        # Also try samefile() in case the path reaches the CWD by another route (e.g. a hard link)
+        try:
+            return not os.path.samefile(path_str, cwd)
+        except (OSError, ValueError):
+            # The path does not exist or cannot be compared, so it is outside CWD (dangerous)
             return True
 
-    def _check_against_paths(self, paths: list[str], path_obj: Path | None = None) -> bool:
-        """Check if a path matches any in the given list.
-
-        Args:
-            paths (list[str]):
-                List of paths to check against.
+    def _match_paths(self, path_str: str | None = None) -> tuple[bool, bool]:
+        """Check a path against both the system paths and the user-defined paths.
 
         Keyword Parameters:
-            path_obj (Path | None):
-                Optional Path object to check. If not provided, uses self._path_obj.
-                Defaults to None.
+            path_str (str | None):
+                Optional resolved path string to check. If not provided, uses the
+                resolved form of self._path. Defaults to None.
 
         Returns:
             (bool):
-                True if the path matches any in the list, False otherwise.
+                True if the path is, or lies beneath, a system path.
+            (bool):
+                True if the path is, or lies beneath, a user-defined path.
+
+        Notes:
+            Both the path and the dangerous paths are compared as case-normalised strings
+            ending in exactly one separator, so a prefix match covers both the exact-match
+            and the subdirectory case without matching siblings such as /etcetera against /etc.
+            The path is normalised once and shared between the two matchers.
         """
-        if path_obj is None:
-            path_obj = self._path_obj
+        if path_str is None:
+            path_str = self._path_str
 
-        for dangerous in paths:
-            try:
-                dangerous_obj = Path(dangerous).resolve()
-                # Check if path is the dangerous path or a subdirectory of it
-                if path_obj == dangerous_obj or dangerous_obj in path_obj.parents:
-                    return True
-            except (OSError, ValueError):
-                # Handle cases where path resolution fails
-                continue
-        return False
+        prefix = _path_prefix(path_str)
+        return self._system_paths.match(prefix), self._user_paths.match(prefix)
 
     def _check_invalid_chars(self, path_str: str | None = None) -> bool:
         """Check if a path contains invalid characters for the platform.
@@ -517,7 +832,6 @@ class BasePathChecker(ABC):
         for char in self._invalid_chars:
             if char in path_str:
                 return True
-
         return False
 
     def __call__(self, path: str | Path | None = None, raise_error: bool = False) -> bool:
@@ -529,7 +843,8 @@ class BasePathChecker(ABC):
         Keyword Parameters:
             path (str | Path | None):
                 Optional path to check. If provided, checks the new path against
-                existing system and user paths (without reloading). If not provided,
+                existing system and user paths (without reloading); its matches against them
+                are remembered until the checker next reloads. If not provided,
                 rechecks the original path against reloaded system and user paths.
                 Defaults to None.
             raise_error (bool):
@@ -556,36 +871,32 @@ class BasePathChecker(ABC):
             DangerousPathError: Path '/etc/passwd' points to a dangerous location
         """
         if path is not None:
-            # Check for invalid characters first
-            has_invalid = self._check_invalid_chars(str(path))
+            raw = os.fspath(path)
 
-            # Try to resolve the path
-            try:
-                path_obj = Path(path).resolve()
-            except (ValueError, OSError):
-                # If path contains invalid characters that prevent resolution,
-                # create a non-resolved Path object
-                path_obj = Path(path)
+            # Resolved afresh on every call, since the path may have become a symbolic link
+            # since it was last checked
+            path_str = _resolve_path(raw, self._follow_symlinks)
+
+            # Run the checks cheapest first, stopping as soon as the path is found dangerous.
+            # Invalid characters are always dangerous, and are looked for in the same form of
+            # the path as when the checker was constructed.
+            checked_str = path_str if self._INVALID_CHARS_RESOLVED else raw
+            is_dangerous = self._check_invalid_chars(checked_str)
 
             # Check against existing paths
-            is_sys_path = self._check_against_paths(self._system_paths, path_obj)
-            is_usr_path = self._check_against_paths(self._user_paths, path_obj)
+            if not is_dangerous:
+                is_sys_path, is_usr_path = self._call_matches(path_str)
+                is_dangerous = is_sys_path and not self._system_ok
+                if not is_dangerous:
+                    is_dangerous = is_usr_path and not self._user_paths_ok
 
-            # Evaluate danger based on settings
-            is_dangerous = has_invalid  # Invalid chars are always dangerous
-            if is_sys_path and not self._system_ok:
-                is_dangerous = True
-            if is_usr_path and not self._user_paths_ok:
-                is_dangerous = True
+            # Check CWD restriction
+            if not is_dangerous and self._cwd_only:
+                is_dangerous = self._check_cwd_traversal(path_str)
 
             # Check writeability
-            if not self._not_writeable:
-                if path_obj.exists() and not os.access(path_obj, os.W_OK):
-                    is_dangerous = True
-
-            # Check CWD restriction
-            if self._cwd_only and self._check_cwd_traversal(path_obj):
-                is_dangerous = True
+            if not is_dangerous and not self._not_writeable:
+                is_dangerous = os.path.exists(path_str) and not os.access(path_str, os.W_OK)
 
             if is_dangerous and raise_error:
                 raise DangerousPathError(f"Path '{path}' points to a dangerous location")
@@ -601,6 +912,58 @@ class BasePathChecker(ABC):
 
             return is_dangerous
 
+    def _call_matches(self, path_str: str) -> tuple[bool, bool]:
+        """Return whether a resolved path lies beneath a system path and a user-defined path.
+
+        The matches depend only on the resolved path string and the loaded paths, so they are
+        kept per checker (keyed on the resolved path) until the loaded system or user paths
+        change. Resolving the path, and the writability and CWD checks, depend on the
+        filesystem's current state and are never cached.
+        """
+        prefix = _path_prefix(path_str)
+        if self._call_cache is None:
+            self._call_cache = {}
+        elif (matches := self._call_cache.get(prefix)) is not None:
+            return matches
+        elif len(self._call_cache) >= _CALL_CACHE_SIZE:
+            # Bound the memory held by a long-lived checker
+            self._call_cache.clear()
+        matches = self._system_paths.match(prefix), self._user_paths.match(prefix)
+        self._call_cache[prefix] = matches
+        return matches
+
+    def check_many(self, paths: Iterable[str | Path]) -> list[bool]:
+        """Check many paths for danger against this checker's settings and loaded paths.
+
+        Args:
+            paths (Iterable[str | Path]):
+                The file paths to check.
+
+        Returns:
+            (list[bool]):
+                For each path, in order, True if it is dangerous, False if safe.
+
+        Notes:
+            Each path is checked exactly as by calling the checker with that path, so the
+            mode and the system_ok, user_paths_ok, not_writeable, cwd_only and follow_symlinks
+            settings all apply. The system and user-defined paths are not reloaded, and paths
+            repeated within the batch are only checked once.
+
+        Examples:
+            >>> checker = PathChecker("/home/user/file.txt")
+            >>> checker.check_many(["/home/user/other.txt", "/etc/passwd"])  # doctest: +SKIP
+            [False, True]
+        """
+        results: dict[str, bool] = {}
+        flags = []
+        for path in paths:
+            path_str = os.fspath(path)
+            is_dangerous = results.get(path_str)
+            if is_dangerous is None:
+                is_dangerous = results[path_str] = self(path_str)
+            flags.append(is_dangerous)
+        return flags
+
     def __bool__(self) -> bool:
         """Return True if the path is safe (not dangerous), False otherwise.
 
@@ -622,6 +985,13 @@ class BasePathChecker(ABC):
         """
         return not self._is_dangerous()
 
+    @property
+    def _path_obj(self) -> Path:
+        """Resolved path as a Path object, built (and kept) only for checks that need one."""
+        if self._path_obj_cache is None:
+            self._path_obj_cache = Path(self._path_str)
+        return self._path_obj_cache
+
     @property
     def is_system_path(self) -> bool:
         """Check if the path is within a platform-specific system directory.
@@ -633,6 +1003,8 @@ class BasePathChecker(ABC):
             (bool):
                 True if the path is within a platform system directory, False otherwise.
         """
+        if self._is_system_path is None:
+            self._is_system_path, self._is_user_path = self._match_paths()
         return self._is_system_path
 
     @property
@@ -645,6 +1017,8 @@ class BasePathChecker(ABC):
             (bool):
                 True if the path matches a user-defined sensitive path, False otherwise.
         """
+        if self._is_user_path is None:
+            self._is_system_path, self._is_user_path = self._match_paths()
         return self._is_user_path
 
     @property
@@ -668,6 +1042,8 @@ class BasePathChecker(ABC):
             (bool):
                 True if the path contains invalid characters, False otherwise.
         """
+        if self._has_invalid_chars is None:
+            self._has_invalid_chars = self._check_invalid_chars()
         return self._has_invalid_chars
 
     @property
@@ -683,7 +1059,7 @@ class BasePathChecker(ABC):
         """
         try:
             # Check if path exists and is readable
-            return os.access(self._path_obj, os.R_OK)
+            return os.access(self._path_str, os.R_OK)
         except (OSError, ValueError):
             return False
 
@@ -700,7 +1076,7 @@ class BasePathChecker(ABC):
         """
         try:
             # Check if path exists and is writable
-            return os.access(self._path_obj, os.W_OK)
+            return os.access(self._path_str, os.W_OK)
         except (OSError, ValueError):
             return False
 
@@ -717,12 +1093,13 @@ class BasePathChecker(ABC):
         """
         try:
             # If path exists, it's not creatable (it already exists)
-            if self._path_obj.exists():
+            if os.path.exists(self._path_str):
                 return False
 
-            # Check if parent directory exists and is writable
-            parent = self._path_obj.parent
-            return parent.exists() and os.access(parent, os.W_OK | os.X_OK)
+            # Check if parent directory exists and is writable (access() is False for a
+            # missing parent, so no separate existence check is needed)
+            parent = os.path.dirname(self._path_str) or os.curdir
+            return os.access(parent, os.W_OK | os.X_OK)
         except (OSError, ValueError):
             return False
 
@@ -762,6 +1139,7 @@ def _create_path_checker(
     user_paths_ok: bool = False,
     not_writeable: bool = False,
     cwd_only: bool = False,
+    follow_symlinks: bool = True,
 ) -> BasePathChecker:
     """Create a platform-specific PathChecker instance.
 
@@ -788,6 +1166,11 @@ def _create_path_checker(
             to prevent path traversal attacks. Paths that resolve outside
             the CWD (e.g., '../../../etc/passwd') are considered dangerous.
             Defaults to False.
+        follow_symlinks (bool):
+            If True, resolve symbolic links before checking the path, so a link
+            pointing into a system directory is caught. If False, the path is only
+            made absolute and normalised, which avoids a filesystem lookup per path
+            component but will not see through symbolic links. Defaults to True.
 
     Returns:
         (BasePathChecker):
@@ -799,49 +1182,24 @@ def _create_path_checker(
         ValueError:
             If mode is not None, "read", or "write".
     """
-    match platform.system():
-        case "Windows":
-            from .platforms.windows.checker import (  # pylint: disable=import-outside-toplevel
-                WindowsPathChecker,
-            )
-
-            return WindowsPathChecker(
-                path,
-                raise_error,
-                mode,
-                system_ok,
-                user_paths_ok,
-                not_writeable,
-                cwd_only,
-            )
-        case "Darwin":
-            from .platforms.darwin.checker import (  # pylint: disable=import-outside-toplevel
-                DarwinPathChecker,
-            )
-
-            return DarwinPathChecker(
-                path,
-                raise_error,
-                mode,
-                system_ok,
-                user_paths_ok,
-                not_writeable,
-                cwd_only,
-            )
-        case _:  # Linux and other Unix-like systems
-            from .platforms.posix.checker import (  # pylint: disable=import-outside-toplevel
-                PosixPathChecker,
-            )
-
-            return PosixPathChecker(
-                path,
-                raise_error,
-                mode,
-                system_ok,
-                user_paths_ok,
-                not_writeable,
-                cwd_only,
-            )
+    return _platform_checker_class()(
+        path,
+        raise_error,
+        mode,
+        system_ok,
+        user_paths_ok,
+        not_writeable,
+        cwd_only,
+        follow_symlinks,
+    )
+
+
+@cache
+def _platform_checker_class() -> type[BasePathChecker]:
+    """Return the checker class for the running platform, importing it on first use."""
+    # Imported lazily as the platform modules themselves import from this module
+    module = import_module(f".platforms.{_PLATFORM_PACKAGE}.checker", __package__)
+    return getattr(module, f"{_PLATFORM_PACKAGE.capitalize()}PathChecker")
 
 
 # PathChecker is the public API - it's a callable class that acts as a factory
@@ -887,6 +1245,11 @@ class PathChecker:
             to prevent path traversal attacks. Paths that resolve outside
             the CWD (e.g., '../../../etc/passwd') are considered dangerous.
             Defaults to False.
+        follow_symlinks (bool):
+            If True, resolve symbolic links before checking the path, so a link
+            pointing into a system directory is caught. If False, the path is only
+            made absolute and normalised, which avoids a filesystem lookup per path
+            component but will not see through symbolic links. Defaults to True.
 
     Raises:
         DangerousPathError:
@@ -954,6 +1317,9 @@ class PathChecker:
         user_paths_ok: bool = False,
         not_writeable: bool = False,
         cwd_only: bool = False,
+        follow_symlinks: bool = True,
     ) -> BasePathChecker:
         """Create a platform-specific PathChecker instance."""
-        return _create_path_checker(path, raise_error, mode, system_ok, user_paths_ok, not_writeable, cwd_only)
+        return _create_path_checker(
+            path, raise_error, mode, system_ok, user_paths_ok, not_writeable, cwd_only, follow_symlinks
+        )
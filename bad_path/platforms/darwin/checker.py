@@ -3,7 +3,12 @@
 This module provides the DarwinPathChecker class for validating paths on macOS systems.
 """
 
-from ...checker import BasePathChecker, get_user_paths
+from ...checker import BasePathChecker
+from .paths import invalid_chars
+
+# Held as a tuple: for so few characters, one C-level substring search per character is
+# faster than hashing every character of the path into a set operation
+_INVALID_CHARS = tuple(invalid_chars)
 
 
 class DarwinPathChecker(BasePathChecker):
@@ -13,24 +18,8 @@ class DarwinPathChecker(BasePathChecker):
     in file names and macOS system directories.
     """
 
+    __slots__ = ()
+
     def _load_invalid_chars(self) -> None:
         """Load Darwin-specific invalid characters."""
-        from .paths import (  # pylint: disable=import-outside-toplevel
-            invalid_chars,
-        )
-
-        self._invalid_chars = invalid_chars
-        self._reserved_names = []
-
-    def _load_and_check_paths(self) -> None:
-        """Load system and user paths, then check the current path against them."""
-        from .paths import (  # pylint: disable=import-outside-toplevel
-            system_paths,
-        )
-
-        self._system_paths = system_paths
-        self._user_paths = get_user_paths()
-
-        # Check both types
-        self._is_system_path = self._check_against_paths(self._system_paths)
-        self._is_user_path = self._check_against_paths(self._user_paths)
+        self._invalid_chars = _INVALID_CHARS
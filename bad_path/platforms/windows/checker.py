@@ -3,9 +3,31 @@
 This module provides the WindowsPathChecker class for validating paths on Windows systems.
 """
 
-from pathlib import Path
+import re
 
-from ...checker import BasePathChecker, get_user_paths
+from ...checker import BasePathChecker
+from .paths import invalid_chars, reserved_names
+
+# Held as a frozenset so the invalid-character test is a single C-level set operation
+_INVALID_CHARS = frozenset(invalid_chars)
+
+# Reserved names, upper-cased and deduplicated for the alternation in _INVALID_PATH_RE
+_RESERVED_NAMES = frozenset(name.upper() for name in reserved_names)
+
+# Every Windows invalid-path rule compiled into one case-insensitive pattern, so that
+# _check_invalid_chars is a single search in the C regex engine
+_INVALID_PATH_RE = re.compile(
+    # Any invalid character other than the colon
+    "[" + "".join(re.escape(char) for char in invalid_chars if char != ":") + "]"
+    # A colon, unless it follows a single leading ASCII drive letter (e.g. C:); the class is
+    # case-sensitive so that IGNORECASE cannot fold other characters (such as U+017F) into it
+    + r"|(?<!^(?-i:[A-Za-z])):"
+    # A reserved name as the final component, with at most one extension
+    + r"|(?:^|[/\\])(?:" + "|".join(map(re.escape, sorted(_RESERVED_NAMES))) + r")(?:\.[^/\\.]*)?\Z"
+    # A final component ending with a space or a period
+    + r"|[ .]\Z",
+    re.IGNORECASE,
+)
 
 
 class WindowsPathChecker(BasePathChecker):
@@ -15,71 +37,14 @@ class WindowsPathChecker(BasePathChecker):
     and Windows-specific invalid characters.
     """
 
-    def _load_invalid_chars(self) -> None:
-        """Load Windows-specific invalid characters and reserved names."""
-        from .paths import (  # pylint: disable=import-outside-toplevel
-            invalid_chars,
-            reserved_names,
-        )
-
-        self._invalid_chars = invalid_chars
-        self._reserved_names = reserved_names
-
-    def _load_and_check_paths(self) -> None:
-        """Load system and user paths, then check the current path against them."""
-        from .paths import (  # pylint: disable=import-outside-toplevel
-            system_paths,
-        )
-
-        self._system_paths = system_paths
-        self._user_paths = get_user_paths()
-
-        # Check both types
-        self._is_system_path = self._check_against_paths(self._system_paths)
-        self._is_user_path = self._check_against_paths(self._user_paths)
+    __slots__ = ()
 
-    def _check_cwd_traversal(self, path_obj: Path | None = None) -> bool:
-        """Check if a path traverses outside the current working directory.
+    # Windows strips trailing periods and spaces when resolving, so "." and "data\\." are valid
+    _INVALID_CHARS_RESOLVED = True
 
-        Windows-specific implementation with case-insensitive comparison.
-
-        Keyword Parameters:
-            path_obj (Path | None):
-                Optional Path object to check. If not provided, uses self._path_obj.
-                Defaults to None.
-
-        Returns:
-            (bool):
-                True if the path is outside CWD (dangerous), False otherwise.
-        """
-        if path_obj is None:
-            path_obj = self._path_obj
-        try:
-            cwd = Path.cwd().resolve()
-
-            # Check if path equals CWD (handles "." case)
-            # Use case-insensitive string comparison for Windows
-            if str(path_obj).lower() == str(cwd).lower():
-                return False  # Path is CWD itself (safe)
-
-            # Also try samefile() if paths exist (handles symlinks, etc.)
-            try:
-                if path_obj.exists() and cwd.exists() and path_obj.samefile(cwd):
-                    return False  # Same file/directory (safe)
-            except (OSError, ValueError, AttributeError):
-                # samefile() not available or failed, continue with relative_to
-                pass
-
-            # Try to express path_obj relative to cwd
-            # If this succeeds, the path is within CWD
-            path_obj.relative_to(cwd)
-            return False  # Path is within CWD (safe)
-        except ValueError:
-            # relative_to raised ValueError, so path is outside CWD
-            return True  # Path is outside CWD (dangerous)
-        except (OSError, RuntimeError):
-            # If other resolution fails, treat as dangerous
-            return True
+    def _load_invalid_chars(self) -> None:
+        """Load Windows-specific invalid characters."""
+        self._invalid_chars = _INVALID_CHARS
 
     def _check_invalid_chars(self, path_str: str | None = None) -> bool:
         """Check for Windows-specific invalid characters.
@@ -91,49 +56,14 @@ class WindowsPathChecker(BasePathChecker):
 
         Keyword Parameters:
             path_str (str | None):
-                Optional path string to check. If not provided, uses self._path.
-                Defaults to None.
+                Optional resolved path string to check. If not provided, uses the
+                resolved form of self._path. Defaults to None.
 
         Returns:
             (bool):
                 True if the path contains invalid characters, False otherwise.
         """
         if path_str is None:
-            path_str = str(self._path_obj)
-
-        # Check for invalid characters
-        for char in self._invalid_chars:
-            if char in path_str:
-                # Special handling for colon on Windows (valid in drive letters like C:)
-                if char == ":":
-                    # Check if colon is part of a drive letter (e.g., C:, D:)
-                    # Valid pattern: single letter followed by colon at start of path
-                    if len(path_str) >= 2 and path_str[1] == ":" and path_str[0].isalpha():
-                        # This is a valid drive letter if it's the only colon
-                        if path_str.count(":") == 1:
-                            continue  # This is a valid drive letter colon
-                return True
-
-        # Check for reserved names (case-insensitive)
-        # Extract the filename from the path using string operations
-        # to avoid Path() issues with invalid characters
-        # Split by both forward slash and backslash
-        path_parts = path_str.replace("\\", "/").split("/")
-        if path_parts:
-            filename = path_parts[-1]
-
-            # Extract name without extension
-            if "." in filename:
-                name_without_ext = filename.rsplit(".", 1)[0].upper()
-            else:
-                name_without_ext = filename.upper()
-
-            # Check if the name (without extension) is a reserved name
-            if name_without_ext in self._reserved_names:
-                return True
-
-            # Check if filename ends with space or period (invalid in Windows)
-            if filename and (filename.endswith(" ") or filename.endswith(".")):
-                return True
-
-        return False
+            path_str = self._path_str
+
+        return _INVALID_PATH_RE.search(path_str) is not None
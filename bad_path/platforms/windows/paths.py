@@ -7,15 +7,21 @@ reserved device names that require special handling.
 
 import os
 
-system_paths = [
-    "C:\\Windows",
-    "C:\\Windows\\System32",
-    "C:\\Program Files",
-    "C:\\Program Files (x86)",
-    "C:\\ProgramData",
-    os.environ.get("WINDIR", "C:\\Windows"),
-    os.environ.get("SYSTEMROOT", "C:\\Windows"),
-]
+# WINDIR and SYSTEMROOT usually both name C:\Windows, so duplicates are dropped
+# (keeping the first occurrence of each path, in order)
+system_paths = list(
+    dict.fromkeys(
+        [
+            "C:\\Windows",
+            "C:\\Windows\\System32",
+            "C:\\Program Files",
+            "C:\\Program Files (x86)",
+            "C:\\ProgramData",
+            os.environ.get("WINDIR", "C:\\Windows"),
+            os.environ.get("SYSTEMROOT", "C:\\Windows"),
+        ]
+    )
+)
 
 # Invalid characters in Windows file names
 # Note: Windows has strict restrictions on characters that can be used in file names.
@@ -0,0 +1,123 @@
+"""Tests for bulk_is_dangerous and filter_safe functions."""
+
+import os
+import platform
+
+import pytest
+
+from bad_path import (
+    add_user_path,
+    bulk_is_dangerous,
+    clear_user_paths,
+    filter_safe,
+    is_dangerous_path,
+)
+
+
+def setup_function():
+    """Clear user paths before each test."""
+    clear_user_paths()
+
+
+def teardown_function():
+    """Clear user paths after each test."""
+    clear_user_paths()
+
+
+def _sample_paths(tmp_path):
+    """Return a mix of safe and dangerous paths for the current platform."""
+    if platform.system() == "Windows":
+        system_path = "C:\\Windows\\System32\\test.txt"
+    else:
+        system_path = "/etc/passwd"
+    return [
+        str(tmp_path / "safe.txt"),
+        system_path,
+        tmp_path / "subdir" / "other.txt",
+        str(tmp_path / "bad\x00name.txt"),
+    ]
+
+
+def test_returns_list_of_bools(tmp_path):
+    """Test that bulk_is_dangerous returns one bool per input path."""
+    paths = _sample_paths(tmp_path)
+    result = bulk_is_dangerous(paths)
+    assert isinstance(result, list)
+    assert len(result) == len(paths)
+    assert all(isinstance(item, bool) for item in result)
+
+
+def test_matches_is_dangerous_path(tmp_path):
+    """Test that bulk_is_dangerous agrees with is_dangerous_path for each path."""
+    paths = _sample_paths(tmp_path)
+    assert bulk_is_dangerous(paths) == [False, True, False, True]
+    # A relative "." is resolved before its invalid characters are checked on Windows
+    paths.append(".")
+    assert bulk_is_dangerous(paths) == [is_dangerous_path(path) for path in paths]
+
+
+def test_user_paths(tmp_path):
+    """Test that bulk_is_dangerous honours user-defined paths."""
+    add_user_path(tmp_path / "sensitive")
+    result = bulk_is_dangerous([tmp_path / "sensitive" / "file.txt", tmp_path / "file.txt"])
+    assert result == [True, False]
+
+
+def test_repeated_paths(tmp_path):
+    """Test that repeated paths in a batch each get a result."""
+    safe = tmp_path / "safe.txt"
+    dangerous = _sample_paths(tmp_path)[1]
+    result = bulk_is_dangerous([safe, str(safe), dangerous, safe, dangerous])
+    assert result == [False, False, True, False, True]
+
+
+def test_empty_input():
+    """Test that an empty input gives an empty result."""
+    assert bulk_is_dangerous([]) == []
+
+
+def test_accepts_generator(tmp_path):
+    """Test that any iterable of paths is accepted."""
+    assert bulk_is_dangerous(tmp_path / f"file{i}.txt" for i in range(3)) == [False] * 3
+
+
+def test_filter_safe(tmp_path):
+    """Test that filter_safe keeps only the safe paths, unchanged and in order."""
+    paths = _sample_paths(tmp_path)
+    assert filter_safe(paths) == [paths[0], paths[2]]
+    assert filter_safe(iter(paths)) == [paths[0], paths[2]]
+    assert filter_safe([]) == []
+
+
+def test_path_since_replaced_by_link(tmp_path):
+    """Test that a path found safe in one batch is found dangerous once it becomes a symlink."""
+    sensitive = tmp_path / "sensitive"
+    sensitive.mkdir()
+    add_user_path(sensitive)
+    link = tmp_path / "cfg"
+
+    assert bulk_is_dangerous([link]) == [False]
+    assert filter_safe([link]) == [link]
+    try:
+        os.symlink(sensitive, link, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("Symbolic links are not supported here")
+    assert bulk_is_dangerous([link]) == [True]
+    assert filter_safe([link]) == []
+
+
+def test_windows_dot_paths_are_safe(tmp_path, monkeypatch):
+    """Test that relative paths Windows resolves away, such as ".", are not invalid there."""
+    if platform.system() != "Windows":
+        pytest.skip("Windows-specific test")
+
+    (tmp_path / "data").mkdir()
+    monkeypatch.chdir(tmp_path)
+    for path in [".", "data\\."]:
+        assert is_dangerous_path(path) is False, f"'{path}' should be safe"
+        assert bulk_is_dangerous([path]) == [False], f"'{path}' should be safe"
+        assert filter_safe([path]) == [path], f"'{path}' should be safe"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--pdb"])
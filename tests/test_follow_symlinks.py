@@ -0,0 +1,92 @@
+"""Tests for PathChecker follow_symlinks parameter."""
+
+import os
+import platform
+
+import pytest
+
+from bad_path import PathChecker, add_user_path, clear_user_paths
+
+
+def setup_function():
+    """Clear user paths before each test."""
+    clear_user_paths()
+
+
+def teardown_function():
+    """Clear user paths after each test."""
+    clear_user_paths()
+
+
+def _make_link(link, target):
+    """Create a directory symlink, skipping the test if the platform does not allow it."""
+    try:
+        os.symlink(target, link, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("Symbolic links are not supported here")
+
+
+def test_follow_symlinks_default_catches_link_into_sensitive_path(tmp_path):
+    """Test that by default a symlink into a sensitive location is detected."""
+    sensitive = tmp_path / "sensitive"
+    sensitive.mkdir()
+    add_user_path(sensitive)
+    link = tmp_path / "link"
+    _make_link(link, sensitive)
+
+    checker = PathChecker(link / "file.txt")
+    assert checker.is_sensitive_path is True
+    assert not checker
+
+
+def test_follow_symlinks_false_does_not_see_through_links(tmp_path):
+    """Test that follow_symlinks=False checks the link path itself."""
+    sensitive = tmp_path / "sensitive"
+    sensitive.mkdir()
+    add_user_path(sensitive)
+    link = tmp_path / "link"
+    _make_link(link, sensitive)
+
+    checker = PathChecker(link / "file.txt", follow_symlinks=False)
+    assert checker.is_sensitive_path is False
+
+
+def test_follow_symlinks_false_still_normalises():
+    """Test that follow_symlinks=False still makes paths absolute and collapses '..'."""
+    if platform.system() == "Windows":
+        path = "C:\\Temp\\..\\Windows\\System32\\test.txt"
+    else:
+        path = "/tmp/../etc/passwd"  # nosec B108
+
+    checker = PathChecker(path, follow_symlinks=False)
+    assert checker.is_system_path is True
+    assert not checker
+
+
+def test_follow_symlinks_false_with_call(tmp_path):
+    """Test that the follow_symlinks setting is used when calling the checker."""
+    sensitive = tmp_path / "sensitive"
+    sensitive.mkdir()
+    add_user_path(sensitive)
+    link = tmp_path / "link"
+    _make_link(link, sensitive)
+
+    assert PathChecker(tmp_path)(link / "file.txt") is True
+    assert PathChecker(tmp_path, follow_symlinks=False)(link / "file.txt") is False
+
+
+def test_call_sees_path_since_replaced_by_link(tmp_path):
+    """Test that calling a checker again notices a path that has since become a symlink."""
+    sensitive = tmp_path / "sensitive"
+    sensitive.mkdir()
+    add_user_path(sensitive)
+    link = tmp_path / "link"
+
+    checker = PathChecker(tmp_path)
+    assert checker(link / "file.txt") is False  # pylint: disable=not-callable
+    _make_link(link, sensitive)
+    assert checker(link / "file.txt") is True  # pylint: disable=not-callable
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--pdb"])
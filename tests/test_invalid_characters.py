@@ -100,6 +100,20 @@ def test_windows_control_chars_are_invalid():
         assert checker.has_invalid_chars is True, f"Control character {i} should be invalid"
 
 
+def test_windows_drive_letter_must_be_ascii():
+    """Test that only an ASCII letter before a leading colon is accepted as a drive letter."""
+    if platform.system() != "Windows":
+        pytest.skip("Windows-specific test")
+
+    for drive in ["C", "c", "Z"]:
+        checker = PathChecker(f"{drive}:\\tmp\\test.txt")
+        assert checker.has_invalid_chars is False, f"Drive '{drive}:' should be valid"
+
+    for drive in ["\u00b2", "\u00bd", "\u09f4", "\u017f", "\u00e9", "1"]:
+        checker = PathChecker(f"{drive}:\\tmp\\test.txt")
+        assert checker.has_invalid_chars is True, f"Drive '{drive}:' should be invalid"
+
+
 def test_windows_reserved_names():
     """Test that Windows reserved names are detected as invalid."""
     if platform.system() != "Windows":
@@ -2,10 +2,19 @@
 
 import os
 import platform
+import stat
 
 import pytest
 
-from bad_path import DangerousPathError, is_dangerous_path
+from bad_path import (
+    DangerousPathError,
+    add_user_path,
+    bulk_is_dangerous,
+    clear_user_paths,
+    is_dangerous_path,
+    is_system_path,
+    remove_user_path,
+)
 
 
 def test_returns_bool_by_default():
@@ -40,5 +49,91 @@ def test_no_error_on_safe_path():
     assert result is False
 
 
+def test_cache_invalidated_by_user_path_changes():
+    """Test that cached results are refreshed when user-defined paths change."""
+    if platform.system() == "Windows":
+        custom_path = os.path.join(os.path.expanduser("~"), "MySensitiveProject")
+    else:
+        custom_path = "/home/user/my_sensitive_project"
+    test_path = os.path.join(custom_path, "file.txt")
+
+    try:
+        assert is_dangerous_path(test_path) is False
+        add_user_path(custom_path)
+        assert is_dangerous_path(test_path) is True
+        remove_user_path(custom_path)
+        assert is_dangerous_path(test_path) is False
+    finally:
+        clear_user_paths()
+
+
+def test_cache_clear_is_exposed():
+    """Test that is_dangerous_path exposes cache_clear and still answers correctly after it."""
+    if platform.system() == "Windows":
+        dangerous_path = "C:\\Windows\\System32\\test.txt"
+        safe_path = os.path.join(os.path.expanduser("~"), "Documents", "test.txt")
+    else:
+        dangerous_path = "/etc/passwd"
+        safe_path = "/tmp/test.txt"  # nosec B108
+
+    assert callable(is_dangerous_path.cache_clear)
+    assert is_dangerous_path(dangerous_path) is True
+    assert is_dangerous_path(safe_path) is False
+    is_dangerous_path.cache_clear()
+    assert is_dangerous_path(dangerous_path) is True
+    assert is_dangerous_path(safe_path) is False
+
+
+def test_path_since_replaced_by_link(tmp_path):
+    """Test that a path found safe is found dangerous once it becomes a symlink."""
+    sensitive = tmp_path / "sensitive"
+    sensitive.mkdir()
+    link = tmp_path / "cfg"
+
+    try:
+        add_user_path(sensitive)
+        assert is_dangerous_path(link) is False
+        try:
+            os.symlink(sensitive, link, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symbolic links are not supported here")
+        assert is_dangerous_path(link) is True
+    finally:
+        clear_user_paths()
+
+
+def test_file_since_made_read_only(tmp_path):
+    """Test that a path found safe is found dangerous once it is a read-only file."""
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        pytest.skip("Read-only files are still writable by root")
+
+    path = tmp_path / "data.txt"
+    assert is_dangerous_path(path) is False
+    path.write_text("test")
+    os.chmod(path, stat.S_IRUSR)
+    try:
+        assert is_dangerous_path(path) is True
+    finally:
+        os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
+
+
+def test_relative_path_with_deleted_cwd(tmp_path):
+    """Test that relative paths are checked without error when the CWD has been deleted."""
+    if platform.system() == "Windows":
+        pytest.skip("The working directory cannot be deleted on Windows")
+
+    cwd = os.getcwd()
+    gone = tmp_path / "gone"
+    gone.mkdir()
+    os.chdir(gone)
+    try:
+        gone.rmdir()
+        assert is_dangerous_path("rel.txt") is False
+        assert is_system_path("rel.txt") is False
+        assert bulk_is_dangerous(["rel.txt"]) == [False]
+    finally:
+        os.chdir(cwd)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--pdb"])
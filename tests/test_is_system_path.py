@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from bad_path import is_system_path
+from bad_path import add_user_path, clear_user_paths, is_sensitive_path, is_system_path
 
 
 def test_with_string_path():
@@ -60,5 +60,40 @@ def test_exact_dangerous_path():
     assert result is True
 
 
+def test_cache_invalidated_by_user_path_changes(tmp_path):
+    """Test that cached results are refreshed when user-defined paths change."""
+    test_path = tmp_path / "project" / "file.txt"
+    try:
+        assert is_system_path(test_path) is False
+        assert is_sensitive_path(test_path) is False
+        add_user_path(tmp_path / "project")
+        assert is_system_path(test_path) is True
+        assert is_sensitive_path(test_path) is True
+    finally:
+        clear_user_paths()
+    assert is_system_path(test_path) is False
+    is_system_path.cache_clear()
+
+
+def test_path_since_replaced_by_link(tmp_path):
+    """Test that a path found unlisted is found listed once it becomes a symlink."""
+    sensitive = tmp_path / "sensitive"
+    sensitive.mkdir()
+    link = tmp_path / "cfg"
+
+    try:
+        add_user_path(sensitive)
+        assert is_system_path(link) is False
+        assert is_sensitive_path(link) is False
+        try:
+            os.symlink(sensitive, link, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symbolic links are not supported here")
+        assert is_system_path(link) is True
+        assert is_sensitive_path(link) is True
+    finally:
+        clear_user_paths()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--pdb"])
@@ -183,6 +183,42 @@ def test_exact_dangerous_path():
     assert not checker  # Dangerous path evaluates to False
 
 
+def test_user_paths_snapshot_at_construction():
+    """Test that deferred checks use the user paths loaded when the checker was created."""
+    system = platform.system()
+
+    if system == "Windows":
+        user_path = "C:\\CustomSensitive\\Data"
+    else:
+        user_path = "/custom/sensitive/data"
+
+    checker = PathChecker(f"{user_path}/file.txt")
+    add_user_path(user_path)
+
+    try:
+        # The checks run lazily, but against the paths loaded at construction
+        assert checker.is_sensitive_path is False
+        assert checker
+        # Calling without a path reloads the user paths
+        assert checker() is True
+        assert checker.is_sensitive_path is True
+    finally:
+        clear_user_paths()
+
+
+def test_sibling_of_dangerous_path_is_not_matched():
+    """Test that a path sharing only a name prefix with a dangerous path is not matched."""
+    system = platform.system()
+
+    if system == "Windows":
+        sibling_path = "C:\\Windowsfoo\\test.txt"
+    else:
+        sibling_path = "/etcetera/test.txt"
+
+    checker = PathChecker(sibling_path)
+    assert checker.is_system_path is False
+
+
 def test_distinction_system_vs_user_paths():
     """Test that is_system_path and is_sensitive_path are properly distinguished."""
     system = platform.system()
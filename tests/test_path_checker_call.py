@@ -356,5 +356,74 @@ def test_raise_error_default_false_in_call():
     assert result is True  # Path is dangerous but no exception raised
 
 
+def test_repeated_call_sees_reloaded_paths():
+    """Test that results remembered by __call__ are discarded when the checker reloads."""
+    system = platform.system()
+
+    if system == "Windows":
+        test_path = "C:\\TestPath"
+        check_path = "C:\\TestPath\\file.txt"
+        safe_path = os.path.join(os.path.expanduser("~"), "Documents", "safe.txt")
+    else:
+        test_path = "/test/path"
+        check_path = "/test/path/file.txt"
+        safe_path = "/tmp/safe.txt"  # nosec B108
+
+    checker = PathChecker(safe_path)
+    try:
+        assert checker(check_path) is False  # pylint: disable=not-callable
+        assert checker(check_path) is False  # pylint: disable=not-callable
+        add_user_path(test_path)
+        checker()  # pylint: disable=not-callable
+        assert checker(check_path) is True  # pylint: disable=not-callable
+    finally:
+        clear_user_paths()
+
+
+def test_call_with_relative_path_and_deleted_cwd(tmp_path):
+    """Test that a relative path is checked without error when the CWD has been deleted."""
+    if platform.system() == "Windows":
+        pytest.skip("The working directory cannot be deleted on Windows")
+
+    checker = PathChecker(tmp_path)
+    cwd = os.getcwd()
+    gone = tmp_path / "gone"
+    gone.mkdir()
+    os.chdir(gone)
+    try:
+        gone.rmdir()
+        assert checker("rel.txt") is False  # pylint: disable=not-callable
+    finally:
+        os.chdir(cwd)
+
+
+def test_check_many_matches_call():
+    """Test that check_many gives the same answers as calling the checker per path."""
+    if platform.system() == "Windows":
+        safe_path = os.path.join(os.path.expanduser("~"), "Documents", "test.txt")
+        dangerous_path = "C:\\Windows\\System32\\test.txt"
+    else:
+        safe_path = "/tmp/test.txt"  # nosec B108
+        dangerous_path = "/etc/passwd"
+
+    checker = PathChecker(safe_path)
+    paths = [safe_path, Path(dangerous_path), dangerous_path, safe_path]
+    assert checker.check_many(paths) == [checker(path) for path in paths]  # pylint: disable=not-callable
+    assert checker.check_many(paths) == [False, True, True, False]
+    assert checker.check_many([]) == []
+
+
+def test_check_many_uses_checker_settings():
+    """Test that check_many honours the flags the checker was created with."""
+    if platform.system() == "Windows":
+        dangerous_path = "C:\\Windows\\System32\\test.txt"
+    else:
+        dangerous_path = "/etc/passwd"
+
+    assert PathChecker(dangerous_path).check_many([dangerous_path]) == [True]
+    lenient = PathChecker(dangerous_path, system_ok=True, not_writeable=True)
+    assert lenient.check_many([dangerous_path]) == [False]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--pdb"])
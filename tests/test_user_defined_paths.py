@@ -10,6 +10,7 @@ from bad_path import (
     clear_user_paths,
     get_dangerous_paths,
     get_user_paths,
+    get_user_paths_view,
     is_dangerous_path,
     is_system_path,
     remove_user_path,
@@ -83,6 +84,23 @@ def test_get_user_paths_returns_copy():
     assert "/another/path" not in get_user_paths()
 
 
+def test_get_user_paths_view():
+    """Test that get_user_paths_view returns an ordered, immutable snapshot."""
+    add_user_path("/path1")
+    add_user_path("/path2")
+    view = get_user_paths_view()
+    assert view == ("/path1", "/path2")
+    # Repeated calls share the same tuple until the paths change
+    assert get_user_paths_view() is view
+    add_user_path("/path3")
+    assert view == ("/path1", "/path2")
+    assert get_user_paths_view() == ("/path1", "/path2", "/path3")
+    remove_user_path("/path1")
+    assert get_user_paths_view() == ("/path2", "/path3")
+    clear_user_paths()
+    assert get_user_paths_view() == ()
+
+
 def test_user_paths_in_dangerous_paths():
     """Test that user paths are included in get_dangerous_paths."""
     test_path = "/my/custom/dangerous/path"
@@ -137,5 +155,42 @@ def test_user_path_with_raise_error():
         is_dangerous_path(f"{test_path}/file.txt", raise_error=True)
 
 
+def test_many_user_paths(tmp_path):
+    """Test matching against enough user paths to use the compiled pattern."""
+    for i in range(100):
+        add_user_path(tmp_path / f"project{i}")
+    # Exact match and subdirectory are detected
+    assert is_system_path(tmp_path / "project42") is True
+    assert is_system_path(tmp_path / "project99" / "data" / "file.txt") is True
+    # Siblings and parents of user paths are not
+    assert is_system_path(tmp_path / "project420" / "file.txt") is False
+    assert is_system_path(tmp_path) is False
+
+
+def test_nested_user_paths(tmp_path):
+    """Test that a user path beneath another still applies once the outer one is removed."""
+    outer = tmp_path / "outer"
+    inner = outer / "inner"
+    add_user_path(outer)
+    add_user_path(inner)
+    assert is_system_path(outer / "file.txt") is True
+    assert is_system_path(inner / "file.txt") is True
+    remove_user_path(outer)
+    assert is_system_path(outer / "file.txt") is False
+    assert is_system_path(inner / "file.txt") is True
+
+
+def test_relative_user_path_follows_cwd(tmp_path, monkeypatch):
+    """Test that a relative user path is re-resolved when the working directory changes."""
+    (tmp_path / "first").mkdir()
+    (tmp_path / "second").mkdir()
+    monkeypatch.chdir(tmp_path / "first")
+    add_user_path("data")
+    assert is_system_path(tmp_path / "first" / "data") is True
+    monkeypatch.chdir(tmp_path / "second")
+    assert is_system_path(tmp_path / "first" / "data") is False
+    assert is_system_path(tmp_path / "second" / "data") is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--pdb"])